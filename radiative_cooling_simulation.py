@@ -20,10 +20,18 @@ time_step = 10
 # Stefan-Boltzmann constant
 sigma = 5.67e-8
 
+# invariant terms of the energy balance, constant for every solve
+T_ambient4 = T_ambient**4
+k_rad = sigma * surface_area * emissivity / (mass * specific_heat)
+
 # importing packages
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from numba import njit
+from scipy.integrate import odeint
+from scipy.interpolate import PchipInterpolator
 
 """The modeling of radiative heat transfer involves several key parameters:
 - Emissivity (ε): Represents how effectively a surface emits thermal radiation compared to a black body.
@@ -34,30 +42,35 @@ from scipy.integrate import solve_ivp
   radiative heat transfer at higher temperatures, explaining why cooling is initially rapid.
 """
 
-# define the ODE representing the energy balance
-def temperature_derivative(t, T):
-    q_rad = sigma * surface_area * emissivity * (T**4 - T_ambient**4)
-    dT_dt = -q_rad / (mass * specific_heat)
-
-    return dT_dt
-
-# time points for solution
-t_span = (0, total_time)
-t_eval = np.arange(0, total_time + time_step, time_step)
-
-# solve
-solution = solve_ivp(
-    temperature_derivative,
-    t_span,
-    [T_initial],
-    method='RK45',
-    t_eval=t_eval,
-    rtol=1e-6
-)
-
-# extract solution
-time = solution.t
-temperature = solution.y[0]
+# the energy balance dT/dt = -k (T⁴ - T∞⁴), k = σAε / (mc), has a closed-form inverse t(T) by partial fractions
+# 1/(T⁴ - T∞⁴) = 1/(4T∞³) [1/(T - T∞) - 1/(T + T∞)] - 1/(2T∞²) 1/(T² + T∞²)
+def time_of_temperature(T, T0, Ta, k):
+    return (np.log((T + Ta) * (T0 - Ta) / ((T - Ta) * (T0 + Ta))) + 2 * (np.arctan(T / Ta) - np.arctan(T0 / Ta))) / (4 * k * Ta**3)
+
+# T(t) by inverting time_of_temperature, t and k broadcast so many trajectories are solved at once
+# t(T) is monotonic on (Ta, T0], so a vectorized bisection converges to machine precision in 64 halvings.
+# Late in fast-cooling runs the bracket collapses to within an ulp of Ta, mid rounds to Ta and t(Ta) is +inf;
+# that correctly keeps low at Ta, so the divide-by-zero is silenced rather than reported
+def analytic_temperature(t, T0, Ta, k, iterations=64):
+    target = np.broadcast_to(k * t, np.broadcast_shapes(np.shape(k), np.shape(t)))
+    low = np.full(target.shape, float(Ta))
+    high = np.full(target.shape, float(T0))
+    with np.errstate(divide='ignore'):
+        for _ in range(iterations):
+            mid = 0.5 * (low + high)
+            # the object passes mid before the target time, so the temperature at that time is below mid
+            passed = time_of_temperature(mid, T0, Ta, 1.0) < target
+            high = np.where(passed, mid, high)
+            low = np.where(passed, low, mid)
+    return 0.5 * (low + high)
+
+# time points for solution, shared by every solve
+# linspace hits total_time exactly instead of accumulating float error like arange
+t_eval = np.linspace(0.0, total_time, int(round(total_time / time_step)) + 1)
+
+# solve, no integrator needed for constant emissivity
+time = t_eval
+temperature = analytic_temperature(t_eval, T_initial, T_ambient, k_rad)
 
 """The simulation reveals the distinctly non-linear cooling profile characteristic of radiative heat transfer:
 1. Initial Rapid Cooling Phase: When the temperature difference is large, the T⁴ term dominates,
@@ -69,35 +82,47 @@ temperature = solution.y[0]
    eventually dominate at small temperature differences.
 """
 
-# Saving original values
-original_time = time.copy()
-original_temperature = temperature.copy()
-
-# calculate radiative heat transfer at each time point
-radiative_heat_transfer = np.zeros_like(temperature)
-for i, T in enumerate(temperature):
-    radiative_heat_transfer[i] = sigma * surface_area * emissivity * (T**4 - T_ambient**4)
-
-# calculate cooling rate (K/s) at each time point
-cooling_rate = np.zeros_like(temperature)
-cooling_rate[0:-1] = -np.diff(temperature) / np.diff(time)
-cooling_rate[-1] = cooling_rate[-2]
+# Saving original values, the base trajectory is never modified in place so no copy is needed
+original_time = time
+original_temperature = temperature
 
 # calculate time to reach specific temperatures
-def time_to_reach_temperature(target_temp):
-    if target_temp >= T_initial or target_temp <= T_ambient:
-        return None
-
-    for i, T in enumerate(temperature):
-        if T <= target_temp:
-            if i > 0:
-                dt = time[i] - time[i-1]
-                dT = temperature[i-1] - temperature[i]
-                offset = (temperature[i-1] - target_temp) / dT * dt
-                return time[i-1] + offset
-            return time[i]
-
-    return None
+# accepts a single target or a sequence of targets, unreachable targets give None (nan in a sequence)
+def time_to_reach_temperature(target_temp, t_arr, T_arr):
+    targets = np.asarray(target_temp, dtype=float)
+
+    # a numerical trajectory that has settled at ambient picks up round-off upticks in its tail,
+    # keep the strictly decreasing prefix so t(T) is a function on it
+    upticks = np.flatnonzero(np.diff(T_arr) >= 0)
+    n = upticks[0] + 1 if upticks.size else T_arr.size
+    t_arr, T_arr = t_arr[:n], T_arr[:n]
+
+    # a monotone PCHIP on the reversed prefix inverts the trajectory for all targets in one construction
+    inverse = PchipInterpolator(T_arr[::-1], t_arr[::-1])
+    times = inverse(targets)
+    reachable = (targets < T_arr[0]) & (targets >= T_arr[-1]) & (targets > T_ambient)
+    times = np.where(reachable, times, np.nan)
+
+    if times.ndim == 0:
+        return None if np.isnan(times) else float(times)
+    return times
+
+# radiative heat transfer and cooling rate in a single pass over the trajectory
+# q_coeff = sigma * A * eps and Ta4 are arguments since numba's cache would freeze them as globals
+@njit(cache=True, fastmath=True)
+def postprocess(time, T, q_coeff, Ta4):
+    N = T.shape[0]
+    q = np.empty(N)
+    rate = np.empty(N)
+
+    for i in range(N):
+        T2 = T[i] * T[i]
+        q[i] = q_coeff * (T2 * T2 - Ta4)
+        if i > 0:
+            rate[i-1] = (T[i-1] - T[i]) / (time[i] - time[i-1])
+
+    rate[N-1] = rate[N-2]
+    return q, rate
 
 # calculate time to reach 90%, 50%, and 10% of cooling
 cooling_range = T_initial - T_ambient
@@ -105,9 +130,12 @@ temp_90_percent = T_initial - 0.1 * cooling_range
 temp_50_percent = T_initial - 0.5 * cooling_range
 temp_10_percent = T_initial - 0.9 * cooling_range
 
-time_90_percent = time_to_reach_temperature(temp_90_percent)
-time_50_percent = time_to_reach_temperature(temp_50_percent)
-time_10_percent = time_to_reach_temperature(temp_10_percent)
+# radiative heat transfer (W) and cooling rate (K/s) of the base case
+radiative_heat_transfer, cooling_rate = postprocess(time, temperature, sigma * surface_area * emissivity, T_ambient4)
+
+# characteristic times of the base case, exact from the closed form
+time_90_percent, time_50_percent, time_10_percent = time_of_temperature(
+    np.array([temp_90_percent, temp_50_percent, temp_10_percent]), T_initial, T_ambient, k_rad)
 
 """The cooling process exhibits distinct time scales that characterize the radiative heat transfer:
 1. Initial Cooling Period (t₉₀): The time to cool by 10% represents the rapid initial response.
@@ -192,114 +220,98 @@ emissivities = [0.2, 0.4, 0.6, 0.8, 1.0]  # Range of emissivities
 masses = [0.2, 0.4, 0.6, 0.8, 1.0] # Range of masses
 specific_heats = [200, 300, 400, 500, 600] # Range of specific heats
 
-# Modified equation
-def temperature_derivative_2(t, T, mass_v, specific_heat_v, emissivity_v):
-    dT_dt = -emissivity_v * sigma * surface_area * (T**4 - T_ambient**4) / (mass_v * specific_heat_v)
-    return dT_dt
-
-# Plotting and calculating ratios for changing emissivity
-plt.figure(figsize=(10, 6))
-for e in emissivities:
-    solution = solve_ivp(
-        temperature_derivative_2,
-        t_span,
-        [T_initial],
-        args=(mass, specific_heat, e),
-        method='RK45',
-        t_eval=t_eval,
-        rtol=1e-6
-      )
-    time = solution.t
-    temperature = solution.y[0]
-    time_50_percent = time_to_reach_temperature(temp_50_percent)
+# All three sweeps as a single batch, one row of parameters per trajectory, solved in closed form
+n_e, n_m, n_sh = len(emissivities), len(masses), len(specific_heats)
+batch_masses = np.concatenate([np.full(n_e, mass), masses, np.full(n_sh, mass)])
+batch_specific_heats = np.concatenate([np.full(n_e + n_m, specific_heat), specific_heats]).astype(float)
+batch_emissivities = np.concatenate([emissivities, np.full(n_m + n_sh, emissivity)])
+batch_k = batch_emissivities * sigma * surface_area / (batch_masses * batch_specific_heats)
+batch_temperatures = analytic_temperature(t_eval, T_initial, T_ambient, batch_k[:, np.newaxis])
+batch_times_50 = time_of_temperature(temp_50_percent, T_initial, T_ambient, batch_k)
+emissivities_temperatures, masses_temperatures, specific_heats_temperatures = np.split(batch_temperatures, [n_e, n_e + n_m])
+emissivities_times_50, masses_times_50, specific_heats_times_50 = np.split(batch_times_50, [n_e, n_e + n_m])
+
+# draws every curve of a sweep as one LineCollection artist, the legend uses lightweight proxy lines
+def plot_sweep(ax, t, T_rows, labels):
+    colors = plt.rcParams['axes.prop_cycle'].by_key()['color'][:len(labels)]
+    segments = np.stack([np.broadcast_to(t, T_rows.shape), T_rows], axis=-1)
+    ax.add_collection(LineCollection(segments, colors=colors))
+    ax.autoscale()
+    ax.legend(handles=[Line2D([], [], color=c, label=label) for c, label in zip(colors, labels)])
+
+# Plotting and calculating ratios for all three sweeps, one figure with a panel per parameter
+fig, axes = plt.subplots(1, 3, figsize=(30, 6))
+
+# changing emissivity
+for e, time_50_percent in zip(emissivities, emissivities_times_50):
     print(f"Time to cool to 50% of temperature difference ({temp_50_percent:.1f} K) at emissivity {e:.1f}: {time_50_percent:.1f} seconds")
-    plt.plot(solution.t, solution.y[0], label=f'Emissivity = {e}')
-
-plt.xlabel('Time (s)')
-plt.ylabel('Temperature (K)')
-plt.title('Impact of Emissivity on Cooling')
-plt.legend()
-plt.grid(True)
-plt.show()
+plot_sweep(axes[0], t_eval, emissivities_temperatures, [f'Emissivity = {e}' for e in emissivities])
+axes[0].set_title('Impact of Emissivity on Cooling')
 
-# Plotting and calculating ratios for changing mass
-plt.figure(figsize=(10, 6))
-for m in masses:
-    solution = solve_ivp(
-        temperature_derivative_2,
-        t_span,
-        [T_initial],
-        args=(m, specific_heat, emissivity),
-        method='RK45',
-        t_eval=t_eval,
-        rtol=1e-6
-      )
-    time = solution.t
-    temperature = solution.y[0]
-    time_50_percent = time_to_reach_temperature(temp_50_percent)
+# changing mass
+for m, time_50_percent in zip(masses, masses_times_50):
     print(f"Time to cool to 50% of temperature difference ({temp_50_percent:.1f} K) at mass {m:.1f}: {time_50_percent:.1f} seconds")
-    plt.plot(solution.t, solution.y[0], label=f'Mass = {m}')
-
-plt.xlabel('Time (s)')
-plt.ylabel('Temperature (K)')
-plt.title('Impact of Mass on Cooling')
-plt.legend()
-plt.grid(True)
-plt.show()
+plot_sweep(axes[1], t_eval, masses_temperatures, [f'Mass = {m}' for m in masses])
+axes[1].set_title('Impact of Mass on Cooling')
 
-# Plotting and calculating ratios for changing specific heat
-plt.figure(figsize=(10, 6))
-for sh in specific_heats:
-    solution = solve_ivp(
-        temperature_derivative_2,
-        t_span,
-        [T_initial],
-        args=(mass, sh, emissivity),
-        method='RK45',
-        t_eval=t_eval,
-        rtol=1e-6
-      )
-    time = solution.t
-    temperature = solution.y[0]
-    time_50_percent = time_to_reach_temperature(temp_50_percent)
+# changing specific heat
+for sh, time_50_percent in zip(specific_heats, specific_heats_times_50):
     print(f"Time to cool to 50% of temperature difference ({temp_50_percent:.1f} K) at specific heat {sh:.1f}: {time_50_percent:.1f} seconds")
-    plt.plot(solution.t, solution.y[0], label=f'Specific heat = {sh}')
+plot_sweep(axes[2], t_eval, specific_heats_temperatures, [f'Specific heat = {sh}' for sh in specific_heats])
+axes[2].set_title('Impact of Specific heat on Cooling')
 
-plt.xlabel('Time (s)')
-plt.ylabel('Temperature (K)')
-plt.title('Impact of Specific heat on Cooling')
-plt.legend()
-plt.grid(True)
+for ax in axes:
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Temperature (K)')
+    ax.grid(True)
 plt.show()
 
 # Simulating non-constant emissivity
 
 # A simple emissivity - temperature function
+# compiled so the RHS below can inline it, np.exp keeps it usable on whole arrays as well as scalars
+@njit(cache=True, fastmath=True)
 def emissivityFunction(T):
-    return 0.992 - 0.35 * np.exp(-0.0045 * (T - 300)) # Constraint: Average 0.8 in [300, 600]K
-
-# Modified ODE to include variable emissivity
-def temperature_derivative_3(t, T):
-    dT_dt = -sigma * surface_area * emissivityFunction(T) * (T**4 - T_ambient**4) / (mass * specific_heat)
-    return dT_dt
+    return 0.992 - 0.35 * np.exp(-0.0045 * (T - 300.0)) # Constraint: Average 0.8 in [300, 600]K
+
+# Modified ODE to include variable emissivity, emissivity is factored out of the constant term
+# k = sigma * A / (m * c) and Ta4 = T_ambient**4 are arguments, numba's cache would freeze them as globals
+k_rad_3 = sigma * surface_area / (mass * specific_heat)
+
+@njit("float64[:](float64, float64[:], float64, float64)", cache=True, fastmath=True)
+def temperature_derivative_3(t, T, k, Ta4):
+    T2 = T[0] * T[0]
+    dT_dt = -k * emissivityFunction(T[0]) * (T2 * T2 - Ta4)
+    return np.array([dT_dt])
+
+# Jacobian with variable emissivity, d(eps)/dT = 0.35 * 0.0045 * exp(-0.0045 * (T - 300))
+@njit("float64[:, :](float64, float64[:], float64, float64)", cache=True, fastmath=True)
+def temperature_jacobian_3(t, T, k, Ta4):
+    T1 = T[0]
+    T3 = T1 * T1 * T1
+    d_emissivity = 0.35 * 0.0045 * np.exp(-0.0045 * (T1 - 300.0))
+    return np.array([[-k * (d_emissivity * (T3 * T1 - Ta4) + 4 * emissivityFunction(T1) * T3)]])
 
 # Extract solution
-solution = solve_ivp(
+solution = odeint(
     temperature_derivative_3,
-    t_span,
     [T_initial],
-    method='RK45',
-    t_eval = t_eval,
-    rtol=1e-6
+    t_eval,
+    args=(k_rad_3, T_ambient4),
+    Dfun=temperature_jacobian_3,
+    tfirst=True,
+    # absolute tolerance on the kelvin scale, first step and step cap on the problem time scale
+    rtol=1e-6,
+    atol=1e-3,
+    h0=time_step,
+    hmax=200.0
   )
-time = solution.t
-temperature = solution.y[0]
+time = t_eval
+temperature = solution[:, 0]
 
 # Calculating metrics
-time_90_percent = time_to_reach_temperature(temp_90_percent)
-time_50_percent = time_to_reach_temperature(temp_50_percent)
-time_10_percent = time_to_reach_temperature(temp_10_percent)
-emissivity_values = [emissivityFunction(T) for T in temperature]
+time_90_percent, time_50_percent, time_10_percent = time_to_reach_temperature([temp_90_percent, temp_50_percent, temp_10_percent], time, temperature)
+emissivity_values = emissivityFunction(temperature)
 
 # Intersection of non-constant emissivty graph and constant emissivity. Give 2 values since the first one is (0, 600)
 idx = np.argwhere(np.diff(np.sign(original_temperature - temperature))).flatten()
@@ -310,7 +322,7 @@ plt.figure(figsize=(25, 10))
 
 # Time - Temperature
 plt.subplot(1, 2, 1)
-plt.plot(solution.t, solution.y[0], label = 'Non-constant emissivity')
+plt.plot(time, temperature, label = 'Non-constant emissivity')
 plt.plot(original_time, original_temperature, label = 'Constant emissivity')
 plt.plot(time[idx[1]], temperature[idx[1]], 'ro', label = 'Intersection')
 plt.xlabel('Time (s)')